@@ -10,11 +10,16 @@ F0 00 7D 4E [MSG_TYPE] [TIMESTAMP_MSB] [TIMESTAMP_LSB] [DATA1] [DATA2] [DATA3] [
 """
 
 import sys
-from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Sequence, Tuple, Optional, Union
+
+
+def _intern_vals(d: dict) -> dict:
+    """Return a copy of a name table with interned string values"""
+    return {k: sys.intern(v) for k, v in d.items()}
+
 
 # Message type definitions
-MESSAGE_TYPES = {
+MESSAGE_TYPES = _intern_vals({
     0x01: "System Event",
     0x02: "Controller Change", 
     0x03: "Memory Usage",
@@ -23,10 +28,10 @@ MESSAGE_TYPES = {
     0x06: "Configuration",
     0x07: "Storage Operation",
     0x08: "Performance Metric"
-}
+})
 
 # System events
-SYSTEM_EVENTS = {
+SYSTEM_EVENTS = _intern_vals({
     0x01: "Startup",
     0x02: "Shutdown",
     0x03: "Mode Change",
@@ -34,10 +39,10 @@ SYSTEM_EVENTS = {
     0x05: "Calibration End",
     0x10: "Test Mode Enter",
     0x11: "Test Mode Exit"
-}
+})
 
 # Controller IDs
-CONTROLLERS = {
+CONTROLLERS = _intern_vals({
     0x01: "Program Change",
     0x02: "Volume",
     0x03: "Pitch Bend",
@@ -46,10 +51,10 @@ CONTROLLERS = {
     0x06: "FX2",
     0x07: "Sustain",
     0x08: "Bank Select"
-}
+})
 
 # Error codes
-ERROR_CODES = {
+ERROR_CODES = _intern_vals({
     0x01: "Memory Allocation Failed",
     0x02: "Flash Write Failed",
     0x03: "Flash Read Failed",
@@ -57,158 +62,331 @@ ERROR_CODES = {
     0x05: "Buffer Overflow",
     0x06: "Calibration Failed",
     0x10: "Debug Buffer Overflow"
-}
+})
 
 # Configuration events
-CONFIG_EVENTS = {
+CONFIG_EVENTS = _intern_vals({
     0x01: "Bank Changed",
     0x02: "Channel Changed",
     0x03: "CC Mapping Changed",
     0x04: "Calibration Updated"
-}
+})
 
 # Storage events
-STORAGE_EVENTS = {
+STORAGE_EVENTS = _intern_vals({
     0x01: "Flash Read",
     0x02: "Flash Write",
     0x03: "Flash Erase",
     0x04: "Load Settings",
     0x05: "Save Settings"
-}
+})
 
 # Performance metrics
-PERF_METRICS = {
+PERF_METRICS = _intern_vals({
     0x01: "Loop Time (ms)",
     0x02: "CPU Usage (%)",
     0x03: "Message Rate",
     0x04: "Buffer Usage (%)"
-}
+})
+
+# SysEx start followed by the manufacturer ID
+_HEADER = b'\xF0\x00\x7D\x4E'
+
+# Whitespace and separator characters stripped from hex input before parsing
+_SEP_DELETE = str.maketrans('', '', ' \t\r\n,;:')
+
+# Two-digit uppercase hex strings indexed by byte value
+_HEX2 = tuple(format(i, '02X') for i in range(256))
+
+# Output templates for each decoded message type
+_FMT_SYS_STARTUP = "[%dms] System Event: %s v%d.%d"
+_FMT_SYS_OTHER = "[%dms] System Event: %s (p1=%d, p2=%d)"
+_FMT_CTRL = "[%dms] Controller %s: %s = %d"
+_FMT_MEM = "[%dms] Memory: %d%% used, %d bytes free"
+_FMT_ERR = "[%dms] ERROR: %s (context=0x%s)"
+_FMT_DBG = "[%dms] Debug: '%s' = %d"
+_FMT_CFG = "[%dms] Config: %s (p1=%d, p2=%d)"
+_FMT_STOR = "[%dms] Storage: %s @ 0x%s%s = 0x%s"
+_FMT_PERF = "[%dms] Performance: %s = %d"
+
+# Maps non-printable bytes to '.' for debug string display
+_PRINTABLE_TBL = bytes(b if 0x20 <= b <= 0x7E else 0x2E for b in range(256))
+
+
+# Fallback labels for codes missing from a name table
+_UNKNOWN = tuple("Unknown(0x" + h + ")" for h in _HEX2)
+
+
+def _name_table(d: dict) -> tuple:
+    """Expand a name table into a tuple indexed by every byte value"""
+    return tuple(d.get(i, _UNKNOWN[i]) for i in range(256))
+
+
+# Dense name tables indexed directly by code
+_SYSTEM_EVENT_NAMES = _name_table(SYSTEM_EVENTS)
+_CONTROLLER_NAMES = _name_table(CONTROLLERS)
+_ERROR_NAMES = _name_table(ERROR_CODES)
+_CONFIG_EVENT_NAMES = _name_table(CONFIG_EVENTS)
+_STORAGE_EVENT_NAMES = _name_table(STORAGE_EVENTS)
+_PERF_METRIC_NAMES = _name_table(PERF_METRICS)
 
 
 class NexusDebugDecoder:
     """Decoder for Nexus MIDI debug messages"""
     
     def __init__(self):
-        self.start_time = datetime.now()
+        # Message handlers indexed by message type
+        self._dispatch = (
+            None,
+            self._decode_system_event,
+            self._decode_controller_change,
+            self._decode_memory_usage,
+            self._decode_error,
+            self._decode_debug_string,
+            self._decode_configuration,
+            self._decode_storage_operation,
+            self._decode_performance_metric,
+        )
     
-    def decode_sysex(self, data: List[int]) -> Optional[str]:
+    def decode_sysex(self, data: Union[bytes, bytearray, Sequence[int]]) -> Optional[str]:
         """
         Decode a SysEx message
         
         Args:
-            data: List of bytes including F0 and F7
+            data: Message bytes, or a list of byte values, including F0 and F7
             
         Returns:
             Decoded message string or None if invalid
         """
-        # Validate message structure
-        if len(data) < 13:  # Minimum size for our format
-            return None
-            
-        if data[0] != 0xF0 or data[-1] != 0xF7:
-            return None
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
             
-        # Check manufacturer ID
-        if data[1] != 0x00 or data[2] != 0x7D or data[3] != 0x4E:
+        # Validate length, trailer and start + manufacturer ID header
+        if len(data) < 13 or data[-1] != 0xF7 or not data.startswith(_HEADER):
             return None
             
         # Extract message components
         msg_type = data[4]
         timestamp = (data[5] << 7) | data[6]  # 14-bit timestamp
-        payload = data[7:12]  # 5 data bytes
+        payload = memoryview(data)[7:12]  # 5 data bytes, no copy
         
-        # Decode based on message type
+        # Dispatch directly to the handler for known message types
+        handler = self._dispatch[msg_type] if msg_type < len(self._dispatch) else None
+        if handler is not None:
+            return handler(timestamp, payload)
+            
         if msg_type not in MESSAGE_TYPES:
-            return f"[{timestamp}ms] Unknown message type: 0x{msg_type:02X}"
+            return f"[{timestamp}ms] Unknown message type: 0x{_HEX2[msg_type]}"
             
         type_name = MESSAGE_TYPES[msg_type]
+        return f"[{timestamp}ms] {type_name}: {' '.join(_HEX2[b] for b in payload)}"
+    
+    def decode_stream(self, buf: Union[bytes, bytearray]) -> Iterator[str]:
+        """
+        Decode every SysEx frame in a buffer of back-to-back messages
+        
+        Args:
+            buf: Raw MIDI bytes containing zero or more F0...F7 frames
+            
+        Yields:
+            Decoded message string for each valid frame
+        """
+        i = 0
+        n = len(buf)
+        find = buf.find
+        rfind = buf.rfind
+        decode = self.decode_sysex
+        while i < n:
+            start = find(0xF0, i)
+            if start < 0:
+                break
+            end = find(0xF7, start + 1)
+            if end < 0:
+                break
+            # A later F0 means the earlier frame was truncated
+            start = rfind(0xF0, start, end)
+            result = decode(buf[start:end + 1])
+            if result:
+                yield result
+            i = end + 1
+    
+    def decode_many(self, buf: Union[bytes, bytearray]) -> List[str]:
+        """
+        Decode every SysEx frame in a buffer into a list
+        
+        Same results as decode_stream, with validation and dispatch inlined
+        for callers that want all messages at once.
         
-        # Decode specific message types
-        if msg_type == 0x01:  # System Event
-            return self._decode_system_event(timestamp, payload)
-        elif msg_type == 0x02:  # Controller Change
-            return self._decode_controller_change(timestamp, payload)
-        elif msg_type == 0x03:  # Memory Usage
-            return self._decode_memory_usage(timestamp, payload)
-        elif msg_type == 0x04:  # Error
-            return self._decode_error(timestamp, payload)
-        elif msg_type == 0x05:  # Debug String
-            return self._decode_debug_string(timestamp, payload)
-        elif msg_type == 0x06:  # Configuration
-            return self._decode_configuration(timestamp, payload)
-        elif msg_type == 0x07:  # Storage Operation
-            return self._decode_storage_operation(timestamp, payload)
-        elif msg_type == 0x08:  # Performance Metric
-            return self._decode_performance_metric(timestamp, payload)
+        Args:
+            buf: Raw MIDI bytes containing zero or more F0...F7 frames
             
-        return f"[{timestamp}ms] {type_name}: {' '.join(f'{b:02X}' for b in payload)}"
+        Returns:
+            Decoded message strings for each valid frame
+        """
+        out = []
+        out_append = out.append
+        dispatch = self._dispatch
+        n_dispatch = len(dispatch)
+        decode = self.decode_sysex
+        i = 0
+        n = len(buf)
+        find = buf.find
+        rfind = buf.rfind
+        while i < n:
+            start = find(0xF0, i)
+            if start < 0:
+                break
+            end = find(0xF7, start + 1)
+            if end < 0:
+                break
+            # A later F0 means the earlier frame was truncated
+            start = rfind(0xF0, start, end)
+            frame = buf[start:end + 1]
+            if len(frame) >= 13 and frame.startswith(_HEADER):
+                msg_type = frame[4]
+                handler = dispatch[msg_type] if msg_type < n_dispatch else None
+                if handler is not None:
+                    out_append(handler((frame[5] << 7) | frame[6], memoryview(frame)[7:12]))
+                else:
+                    # Unknown message types take the regular path
+                    out_append(decode(frame))
+            i = end + 1
+        return out
     
-    def _decode_system_event(self, timestamp: int, payload: List[int]) -> str:
-        event = SYSTEM_EVENTS.get(payload[0], f"Unknown(0x{payload[0]:02X})")
+    @staticmethod
+    def _decode_system_event(timestamp: int, payload: memoryview) -> str:
+        event = _SYSTEM_EVENT_NAMES[payload[0]]
         param1 = payload[1]
         param2 = payload[2]
         
         if payload[0] == 0x01:  # Startup
-            version = f"{param1}.{param2}"
-            return f"[{timestamp}ms] System Event: {event} v{version}"
+            return _FMT_SYS_STARTUP % (timestamp, event, param1, param2)
         else:
-            return f"[{timestamp}ms] System Event: {event} (p1={param1}, p2={param2})"
+            return _FMT_SYS_OTHER % (timestamp, event, param1, param2)
     
-    def _decode_controller_change(self, timestamp: int, payload: List[int]) -> str:
+    @staticmethod
+    def _decode_controller_change(timestamp: int, payload: memoryview) -> str:
         event_type = "Change" if payload[0] == 0x01 else "Calibrated"
-        controller = CONTROLLERS.get(payload[1], f"Unknown(0x{payload[1]:02X})")
+        controller = _CONTROLLER_NAMES[payload[1]]
         value = payload[2]
-        return f"[{timestamp}ms] Controller {event_type}: {controller} = {value}"
+        return _FMT_CTRL % (timestamp, event_type, controller, value)
     
-    def _decode_memory_usage(self, timestamp: int, payload: List[int]) -> str:
+    @staticmethod
+    def _decode_memory_usage(timestamp: int, payload: memoryview) -> str:
         usage_percent = payload[0]
         free_bytes = (payload[1] << 7) | payload[2]
-        return f"[{timestamp}ms] Memory: {usage_percent}% used, {free_bytes} bytes free"
+        return _FMT_MEM % (timestamp, usage_percent, free_bytes)
     
-    def _decode_error(self, timestamp: int, payload: List[int]) -> str:
-        error = ERROR_CODES.get(payload[0], f"Unknown(0x{payload[0]:02X})")
+    @staticmethod
+    def _decode_error(timestamp: int, payload: memoryview) -> str:
+        error = _ERROR_NAMES[payload[0]]
         context = payload[1]
-        return f"[{timestamp}ms] ERROR: {error} (context=0x{context:02X})"
+        return _FMT_ERR % (timestamp, error, _HEX2[context])
     
-    def _decode_debug_string(self, timestamp: int, payload: List[int]) -> str:
+    @staticmethod
+    def _decode_debug_string(timestamp: int, payload: memoryview) -> str:
         # Convert 4 bytes to ASCII string
-        chars = []
-        for i in range(4):
-            if payload[i] >= 0x20 and payload[i] <= 0x7E:
-                chars.append(chr(payload[i]))
-            else:
-                chars.append('.')
-        string = ''.join(chars).rstrip()
+        string = bytes(payload[:4]).translate(_PRINTABLE_TBL).decode('ascii').rstrip()
         value = payload[4]
-        return f"[{timestamp}ms] Debug: '{string}' = {value}"
+        return _FMT_DBG % (timestamp, string, value)
     
-    def _decode_configuration(self, timestamp: int, payload: List[int]) -> str:
-        event = CONFIG_EVENTS.get(payload[0], f"Unknown(0x{payload[0]:02X})")
+    @staticmethod
+    def _decode_configuration(timestamp: int, payload: memoryview) -> str:
+        event = _CONFIG_EVENT_NAMES[payload[0]]
         param1 = payload[1]
         param2 = payload[2]
-        return f"[{timestamp}ms] Config: {event} (p1={param1}, p2={param2})"
+        return _FMT_CFG % (timestamp, event, param1, param2)
     
-    def _decode_storage_operation(self, timestamp: int, payload: List[int]) -> str:
-        event = STORAGE_EVENTS.get(payload[0], f"Unknown(0x{payload[0]:02X})")
+    @staticmethod
+    def _decode_storage_operation(timestamp: int, payload: memoryview) -> str:
+        event = _STORAGE_EVENT_NAMES[payload[0]]
         address = (payload[1] << 7) | payload[2]
         value = payload[3]
-        return f"[{timestamp}ms] Storage: {event} @ 0x{address:04X} = 0x{value:02X}"
+        return _FMT_STOR % (timestamp, event, _HEX2[address >> 8], _HEX2[address & 0xFF], _HEX2[value])
     
-    def _decode_performance_metric(self, timestamp: int, payload: List[int]) -> str:
-        metric = PERF_METRICS.get(payload[0], f"Unknown(0x{payload[0]:02X})")
+    @staticmethod
+    def _decode_performance_metric(timestamp: int, payload: memoryview) -> str:
+        metric = _PERF_METRIC_NAMES[payload[0]]
         value = payload[1]
-        return f"[{timestamp}ms] Performance: {metric} = {value}"
+        return _FMT_PERF % (timestamp, metric, value)
+
+
+# Most bytes of an unterminated frame carried over to the next input line
+_MAX_PENDING = 64
+
+
+def hex_string_to_bytes(hex_str: str) -> bytes:
+    """Convert hex string to bytes, ignoring 0x prefixes and separators"""
+    hex_str = hex_str.replace('0x', '').replace('0X', '')
+    return bytes.fromhex(hex_str.translate(_SEP_DELETE))
 
 
-def hex_string_to_bytes(hex_str: str) -> List[int]:
-    """Convert hex string to list of bytes"""
-    hex_str = hex_str.replace(' ', '').replace('\n', '')
-    return [int(hex_str[i:i+2], 16) for i in range(0, len(hex_str), 2)]
+def _decode_line(decoder: NexusDebugDecoder, pending: bytearray, line: str) -> None:
+    """
+    Decode and print the messages in one line of hex input
+    
+    Args:
+        decoder: Decoder used for complete frames
+        pending: Unterminated frame carried over from earlier lines, updated in place
+        line: Hex text for this line
+    """
+    # Parse hex input
+    try:
+        data = hex_string_to_bytes(line)
+    except ValueError:
+        print("Invalid hex format")
+        return
+        
+    # A new F0 before any F7 abandons the unterminated frame
+    first_end = data.find(0xF7)
+    if pending and data.find(0xF0, 0, first_end if first_end >= 0 else len(data)) >= 0:
+        print("Invalid or unrecognized SysEx message")
+        pending.clear()
+        
+    pending += data
+    
+    # Decode all complete messages, reporting every dropped frame in order
+    end = pending.rfind(0xF7)
+    if end >= 0:
+        for segment in bytes(pending[:end]).split(b'\xF7'):
+            # Each F0 starts a frame; only the last one reaches this F7
+            start = segment.rfind(0xF0)
+            for _ in range(segment.count(0xF0, 0, max(start, 0))):
+                print("Invalid or unrecognized SysEx message")
+            result = decoder.decode_sysex(segment[start:] + b'\xF7') if start >= 0 else None
+            print(result or "Invalid or unrecognized SysEx message")
+        del pending[:end + 1]
+            
+    # Keep only a started frame, and only while it can still be valid
+    start = pending.rfind(0xF0)
+    if start < 0:
+        if pending and end < 0:
+            print("Invalid or unrecognized SysEx message")
+        pending.clear()
+    elif len(pending) - start > _MAX_PENDING:
+        print("Invalid or unrecognized SysEx message")
+        pending.clear()
+    else:
+        del pending[:start]
+        print("Incomplete SysEx message, waiting for F7")
 
 
 def main():
     """Main entry point for command-line usage"""
     decoder = NexusDebugDecoder()
+    pending = bytearray()
+    
+    # Piped input: decode line by line without prompts
+    if not sys.stdin.isatty():
+        for line in sys.stdin:
+            line = line.strip()
+            if line.lower() == 'quit':
+                break
+            if line:
+                _decode_line(decoder, pending, line)
+        if pending:
+            print("Invalid or unrecognized SysEx message")
+        return
     
     print("Nexus MIDI Debug Message Decoder")
     print("Enter SysEx messages as hex (e.g., F0 00 7D 4E 01 00 0A 01 02 00 00 00 00 F7)")
@@ -223,19 +401,7 @@ def main():
             if not line:
                 continue
                 
-            # Parse hex input
-            try:
-                bytes_data = hex_string_to_bytes(line)
-            except ValueError:
-                print("Invalid hex format")
-                continue
-                
-            # Decode message
-            result = decoder.decode_sysex(bytes_data)
-            if result:
-                print(result)
-            else:
-                print("Invalid or unrecognized SysEx message")
+            _decode_line(decoder, pending, line)
                 
         except KeyboardInterrupt:
             print("\nExiting...")
@@ -245,4 +411,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()